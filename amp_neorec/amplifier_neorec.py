@@ -505,7 +505,7 @@ class AMP_NeoRec(ModuleBase):
                 d, disconnected = self.amp.read(self.channel_indices, len(self.eeg_indices))
             finally:
                 self._thLock.acquire()
-            self.output_timer = time.process_time()
+            self.output_timer = time.perf_counter_ns()
         else:
             d, disconnected = self.amp.read(self.channel_indices, len(self.eeg_indices))
 
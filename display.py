@@ -17,16 +17,14 @@ import time
 import qwt
 import qwt as Qwt
 
-from qwt.scale_widget import QwtScaleWidget
-
 from res import frmScopeOnline
 from modbase import *
 
 from operator import itemgetter
 from collections import defaultdict
 
-from PyQt6.QtCore import QSize, Qt, QRect, QPoint
-from PyQt6.QtWidgets import QApplication, QFrame
+from PyQt6.QtCore import QSize, Qt
+from PyQt6.QtWidgets import QFrame
 from PyQt6.QtGui import QBrush, QPen, QFont
 
 
@@ -307,7 +305,7 @@ class DISP_Scope(qwt.QwtPlot, ModuleBase):
         if self.dataavailable:
             self.dataavailable = False
             # send performance / utilization event
-            totaltime = 1000.0 * self.eeg.performance_timer_max
+            totaltime = 1e-6 * self.eeg.performance_timer_max
             sampletime = 1000.0 * totaltime / self.eeg.sample_channel.shape[1]
             utilization = sampletime * self.eeg.sample_rate / 1e6 * 100.0
             if self._instance == 0:
@@ -16,7 +16,7 @@ This file is part of PyCorderPlus
 from modbase import *
 
 from PyQt6.QtWidgets import (QApplication, QDialog, QHeaderView, QTableWidgetItem)
-from PyQt6.QtCore import Qt, QMetaType, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont, QIntValidator, QValidator, QColor
 
 from res import frmImpedanceDisplay
@@ -1,4 +1,5 @@
 @echo off
 call python -m venv .\venv
 call .\venv\Scripts\activate
-python -m pip install -r requirements.txt
\ No newline at end of file
+python -m pip install -r requirements.txt
+python -m compileall -q -x venv .
\ No newline at end of file
@@ -22,9 +22,11 @@ Available modules:
 """
 
 import collections
+import functools
 import re
+from xml.sax.saxutils import escape, quoteattr
 
-from PyQt6.QtWidgets import QApplication, QMainWindow, QDialog, QWidget, QGridLayout, QMessageBox, QFileDialog
+from PyQt6.QtWidgets import QApplication, QMainWindow, QDialog, QWidget, QVBoxLayout, QMessageBox, QFileDialog
 from PyQt6.QtGui import QPixmap, QFont
 from PyQt6.QtCore import QDir, QTimer
 from PyQt6.QtBluetooth import QBluetoothLocalDevice
@@ -41,22 +43,30 @@ from res import frmMainStatusBar
 from res import frmLogView
 
 """
-Import and instantiate recording modules.
+Import recording modules base.
+The recording modules are imported and instantiated in InstantiateModules().
 """
 
 from modbase import *
-from amp_actichamp.amplifier_actichamp import AMP_ActiChamp
-from amp_neorec.amplifier_neorec import AMP_NeoRec
-from montage import MNT_Recording
-from display import DISP_Scope
-from impedance import IMP_Display
-from storage import StorageVision
-from trigger import TRG_Eeg
-from filter import FLT_Eeg
 
 NAME_APPLICATION = "PyCorderPlus"
 __version__ = "1.0.0"
 
+# amplifier module class names
+NAME_AMP_ACTICHAMP = "AMP_ActiChamp"
+NAME_AMP_NEOREC = "AMP_NeoRec"
+
+# preferences directory (relative to the user home directory) and file name
+_APPDIR = "." + NAME_APPLICATION
+_PREF_FILENAME = "preferences.xml"
+
+# compiled XPath for the application root element of configuration and preferences files
+_XP_ROOT = etree.XPath("/PyCorderPlus")
+
+# reusable XML parsers for preferences and configuration files, without ID collection
+_PREF_PARSER = etree.XMLParser(collect_ids=False, remove_blank_text=True)
+_CFG_PARSER = objectify.makeparser(collect_ids=False, remove_blank_text=True)
+
 
 def InstantiateModules(name_amp):
     """
@@ -64,30 +74,32 @@ def InstantiateModules(name_amp):
     Modules will be connected top -> down, starting with array index 0.
     @return: list with instantiated module objects
     """
-    modules = []
-
-    if name_amp == AMP_ActiChamp.__name__:
-        modules = [
-            AMP_ActiChamp(),
-            MNT_Recording(),
-            TRG_Eeg(),
-            StorageVision(),
-            FLT_Eeg(),
-            IMP_Display(),
-            DISP_Scope(instance=0),
-        ]
-    elif name_amp == AMP_NeoRec.__name__:
-        modules = [
-            AMP_NeoRec(),
-            MNT_Recording(),
-            TRG_Eeg(),
-            StorageVision(),
-            FLT_Eeg(),
-            IMP_Display(),
-            DISP_Scope(instance=0),
-        ]
-
-    return modules
+    # import the modules only when they are needed
+    if name_amp == NAME_AMP_ACTICHAMP:
+        from amp_actichamp.amplifier_actichamp import AMP_ActiChamp
+        amplifier = AMP_ActiChamp()
+    elif name_amp == NAME_AMP_NEOREC:
+        from amp_neorec.amplifier_neorec import AMP_NeoRec
+        amplifier = AMP_NeoRec()
+    else:
+        return []
+
+    from montage import MNT_Recording
+    from display import DISP_Scope
+    from impedance import IMP_Display
+    from storage import StorageVision
+    from trigger import TRG_Eeg
+    from filter import FLT_Eeg
+
+    return [
+        amplifier,
+        MNT_Recording(),
+        TRG_Eeg(),
+        StorageVision(),
+        FLT_Eeg(),
+        IMP_Display(),
+        DISP_Scope(instance=0),
+    ]
 
 
 class MainWindow(QMainWindow, frmMain.Ui_MainWindow):
@@ -99,6 +111,7 @@ class MainWindow(QMainWindow, frmMain.Ui_MainWindow):
     signal_parentevent = pyqtSignal("PyQt_PyObject")
     signal_check_bluetooth = pyqtSignal(bool)
     signal_search = pyqtSignal(bool)
+    signal_connected = pyqtSignal()
 
     signal_close = pyqtSignal(str)
 
@@ -106,6 +119,16 @@ class MainWindow(QMainWindow, frmMain.Ui_MainWindow):
 
     def __init__(self):
         super().__init__()
+        self._init_ui_only()
+
+        # the module chain is built as soon as the event loop is running,
+        # so the main window is shown before the modules are instantiated
+        QTimer.singleShot(0, self._init_modules)
+
+    def _init_ui_only(self):
+        """
+        Setup the main window widgets, menu and button actions and load the preferences
+        """
         self.setupUi(self)
 
         # create status bar
@@ -124,12 +147,21 @@ class MainWindow(QMainWindow, frmMain.Ui_MainWindow):
         self.statusWidget.signal_showLog.connect(self.showLogEntries)
         self.statusWidget.signal_saveLog.connect(self.saveLogFile)
 
+        # widgets which are disabled while recording
+        self._toggle_widgets = (self.pushButtonConfiguration,
+                                self.actionLoad_Configuration,
+                                self.actionSave_Configuration,
+                                self.actionQuit,
+                                self.actionDefault_Configuration)
+
         # buttons action to select amplifier type
         self.actionActiCHamp_Plus.triggered.connect(self._restart)
         self.actionNeoRec.triggered.connect(self._restart)
 
+        # the NeoRec search thread reports a connected amplifier to the GUI thread
+        self.signal_connected.connect(self.neorec_connected)
+
         # preferences
-        self.application_name = "PyCorderPlus"
         self.name_amplifier = ""
         self.configuration_file = ""
         self.configuration_dir = ""
@@ -137,12 +169,64 @@ class MainWindow(QMainWindow, frmMain.Ui_MainWindow):
         self.loadPreferences()
         self.recording_mode = -1
 
+        # no modules until _init_modules() is done
+        self.modules = []
+        self._modules_flat = ()
+        self.topmodule = None
+        self._is_neorec = False
+        self.search = False
+
+        # lock the user interface until the module chain is ready
+        self.updateUI(isRunning=True)
+
+    def _init_modules(self):
+        """
+        Build the module chain. This runs from the event loop, outside of the
+        exception handler in main(), so errors are reported here and the
+        application is closed.
+        """
+        try:
+            self._build_module_chain()
+        except Exception as e:
+            tb = GetExceptionTraceBack()[0]
+            QMessageBox.critical(None, "PyCorderPlus", tb + " -> " + str(e))
+            # stop a running NeoRec search and close its dialog. signal_search would
+            # start a new search, so disconnect it before telling the listeners.
+            if self.search:
+                self.search = False
+                try:
+                    self.signal_search.disconnect(self.search_neorec)
+                except TypeError:
+                    pass
+                self.signal_search.emit(False)
+                self.signal_close.emit("close")
+            if self.topmodule is not None and self._is_neorec:
+                try:
+                    self.topmodule.amp.close()
+                except Exception:
+                    pass
+            # release what has been created so far, the module chain is not usable
+            for module in self._modules_flat:
+                try:
+                    module.terminate()
+                except Exception:
+                    pass
+            self.modules = []
+            self._modules_flat = ()
+            self.topmodule = None
+            self.close()
+
+    def _build_module_chain(self):
+        """
+        Instantiate and connect the module chain, insert the module panes
+        and load the last configuration
+        """
         # create module chain (top = index 0, bottom = last index)
         self.defineModuleChain()
 
         # connect modules
-        for idx_vertical in range(len(self.modules) - 1):
-            self.modules[idx_vertical].add_receiver(self.modules[idx_vertical + 1])
+        for upstream, downstream in zip(self.modules, self.modules[1:]):
+            upstream.add_receiver(downstream)
 
         # get the top module
         self.topmodule = self.modules[0]
@@ -156,8 +240,12 @@ class MainWindow(QMainWindow, frmMain.Ui_MainWindow):
         # get the bottom module
         self.bottommodule = self.modules[-1]
 
+        # amplifier type of the top module
+        self._amp_class_name = self.topmodule.__class__.__name__
+        self._is_neorec = self._amp_class_name == NAME_AMP_NEOREC
+
         # get name class Amplifier, if current topmodule is NeoRec than begin search device
-        if self.topmodule.__class__.__name__ == AMP_NeoRec.__name__:
+        if self._is_neorec:
             self.search = True
             # disabled button select NeoRec in Menu/View
             self.actionNeoRec.setDisabled(True)
@@ -165,47 +253,74 @@ class MainWindow(QMainWindow, frmMain.Ui_MainWindow):
             self.signal_search.connect(self.search_neorec)
             self.signal_search.emit(self.search)
             # adapt the status bar to NeoRec
-            self.statusWidget.adapt_statusBar(self.topmodule.__class__.__name__)
+            self.statusWidget.adapt_statusBar(self._amp_class_name)
 
-        elif self.topmodule.__class__.__name__ == AMP_ActiChamp.__name__:
+        elif self._amp_class_name == NAME_AMP_ACTICHAMP:
             self.actionActiCHamp_Plus.setDisabled(True)
 
-        # get signal panes for plot area
-        self.horizontalLayout_SignalPane.removeItem(self.horizontalLayout_SignalPane.itemAt(0))
-        for module in flatten(self.modules):
+        # collect signal and online configuration panes in a single pass
+        display_panes = []
+        online_panes = []
+        for module in self._modules_flat:
+            module.main_object = self
             pane = module.get_display_pane()
             if pane is not None:
-                self.horizontalLayout_SignalPane.addWidget(pane)
-
-        # initial module chain update (top module)
-        self.topmodule.update_receivers()
-
-        # insert online configuration panes
-        position = 0
-        for module in flatten(self.modules):
-            module.main_object = self
+                display_panes.append(pane)
             pane = module.get_online_configuration()
             if pane is not None:
-                self.verticalLayout_OnlinePane.insertWidget(position, pane)
-                position += 1
+                online_panes.append(pane)
 
-        # load configuration file
-        # try to load the last configuration file
+        # suspend repainting until the panes are inserted and the configuration is applied
+        self.setUpdatesEnabled(False)
         try:
-            if len(self.configuration_file) > 0:
-                cfg = os.path.normpath(self.configuration_dir + '/' + self.configuration_file)
+            # insert signal panes into plot area
+            self.horizontalLayout_SignalPane.removeItem(self.horizontalLayout_SignalPane.itemAt(0))
+            addWidget = self.horizontalLayout_SignalPane.addWidget
+            for pane in display_panes:
+                addWidget(pane)
+
+            # insert online configuration panes above the configuration button
+            insertWidget = self.verticalLayout_OnlinePane.insertWidget
+            for position, pane in enumerate(online_panes):
+                insertWidget(position, pane)
+
+            # initial module chain update (top module)
+            self.topmodule.update_receivers()
+
+            # try to load the last configuration file
+            self._loadLastConfiguration()
+
+            # update log text module info
+            self.updateModuleInfo()
+
+            # update button states
+            self.updateUI()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _loadLastConfiguration(self):
+        """
+        Load the last used configuration file, use default values if not available
+        """
+        if len(self.configuration_file) > 0:
+            cfg = os.path.normpath(os.path.join(self.configuration_dir, self.configuration_file))
+            try:
                 self._loadConfiguration(cfg)
-            else:
+            except Exception as e:
+                # module setXML() implementations raise generic exceptions, so report any of them
+                tb = GetExceptionTraceBack()[0]
+                self.processEvent(
+                    ModuleEvent(
+                        "Load Configuration",
+                        EventType.ERROR,
+                        tb + " -> %s " % cfg + str(e),
+                        severity=ErrorSeverity.IGNORE
+                    )
+                )
                 self.defaultConfiguration()
-        except:
+        else:
             self.defaultConfiguration()
 
-        # update log text module info
-        self.updateModuleInfo()
-
-        # update button states
-        self.updateUI()
-
     def change_search(self, flag):
         self.search = flag
 
@@ -228,7 +343,6 @@ class MainWindow(QMainWindow, frmMain.Ui_MainWindow):
         # start searching for an amplifier
         conn = threading.Thread(target=self._search)
         conn.start()
-        pass
 
     def stop_search(self):
         self.search = False
@@ -254,46 +368,49 @@ class MainWindow(QMainWindow, frmMain.Ui_MainWindow):
         self.signal_check_bluetooth.emit(True)
 
         # search, connection, obtaining information about the amplifier
-        connected = self.topmodule.connection_amp()
+        connected = False
         while not connected and self.search:
-            connected = self.topmodule.connection_amp()
+            topmodule = self.topmodule
+            # the module chain has been released
+            if topmodule is None:
+                return
+            connected = topmodule.connection_amp()
 
         # if the window about connecting to NeoRec is closed
         if not self.search:
             return
 
         if connected:
-            self.signal_close.emit("close")
-            self.topmodule.set_device_info()
-            self.updateModuleInfo()
+            self.signal_connected.emit()
+
+    def neorec_connected(self):
+        """
+        The NeoRec amplifier is connected, update device information within the GUI thread
+        :return:
+        """
+        self.signal_close.emit("close")
+        self.topmodule.set_device_info()
+        self.updateModuleInfo()
 
     def _restart(self):
         """
         Restart MainWindow for new type amplifier
         :return:
         """
-        if self.name_amplifier == AMP_NeoRec.__name__:
-            self.name_amplifier = AMP_ActiChamp.__name__
-        elif self.name_amplifier == AMP_ActiChamp.__name__:
-            self.name_amplifier = AMP_NeoRec.__name__
+        if self.name_amplifier == NAME_AMP_NEOREC:
+            self.name_amplifier = NAME_AMP_ACTICHAMP
+        elif self.name_amplifier == NAME_AMP_ACTICHAMP:
+            self.name_amplifier = NAME_AMP_NEOREC
         self.close()
         QApplication.exit(self.RESTART)
 
     def updateUI(self, isRunning=False):
         """ Update user interface to reflect the recording state
         """
-        if isRunning:
-            self.pushButtonConfiguration.setEnabled(False)
-            self.actionLoad_Configuration.setEnabled(False)
-            self.actionSave_Configuration.setEnabled(False)
-            self.actionQuit.setEnabled(False)
-            self.actionDefault_Configuration.setEnabled(False)
-        else:
-            self.pushButtonConfiguration.setEnabled(True)
-            self.actionLoad_Configuration.setEnabled(True)
-            self.actionSave_Configuration.setEnabled(True)
-            self.actionQuit.setEnabled(True)
-            self.actionDefault_Configuration.setEnabled(True)
+        enabled = not isRunning
+        for widget in self._toggle_widgets:
+            widget.setEnabled(enabled)
+        if enabled:
             self.statusWidget.resetUtilization()
 
     def defaultConfiguration(self):
@@ -302,7 +419,7 @@ class MainWindow(QMainWindow, frmMain.Ui_MainWindow):
         Set default values for all modules
         """
         # reset all modules
-        for module in flatten(self.modules):
+        for module in self._modules_flat:
             module.setDefault()
 
         # update module chain, starting from top module
@@ -357,12 +474,11 @@ class MainWindow(QMainWindow, frmMain.Ui_MainWindow):
         @param filename: Full qualified XML file name
         """
         ok = True
-        cfg = objectify.parse(filename)
 
         # check application and version
-        app = cfg.xpath("//PyCorderPlus")
+        version = getRootVersion(filename)
 
-        if (len(app) == 0) or (app[0].get("version") is None):
+        if version is None:
             # configuration data not found
             self.processEvent(
                 ModuleEvent(
@@ -375,7 +491,6 @@ class MainWindow(QMainWindow, frmMain.Ui_MainWindow):
             ok = False
 
         if ok:
-            version = app[0].get("version")
             if cmpver(version, __version__, 2) > 0:
                 # wrong version
                 self.processEvent(
@@ -390,14 +505,15 @@ class MainWindow(QMainWindow, frmMain.Ui_MainWindow):
 
         # setup modules from configuration file
         if ok:
-            for module in flatten(self.modules):
+            cfg = parseConfiguration(filename)
+            for module in self._modules_flat:
                 module.setXML(cfg)
 
         # update module chain, starting from top module
         self.topmodule.update_receivers()
 
         # update status line
-        file_name, ext = os.path.splitext(os.path.split(filename)[1])
+        file_name, ext = os.path.splitext(os.path.basename(filename))
         self.processEvent(ModuleEvent("Application", EventType.STATUS, info=file_name, status_field="Workspace"))
 
     def saveConfiguration(self):
@@ -424,7 +540,7 @@ class MainWindow(QMainWindow, frmMain.Ui_MainWindow):
                 self.configuration_file = fn
                 self.configuration_dir = dir
                 # update status line
-                fn, ext = os.path.splitext(os.path.split(file_name)[1])
+                fn, ext = os.path.splitext(os.path.basename(file_name))
                 self.processEvent(ModuleEvent("Application",
                                               EventType.STATUS,
                                               info=fn,
@@ -442,68 +558,70 @@ class MainWindow(QMainWindow, frmMain.Ui_MainWindow):
         E = objectify.E
         modules = E.modules()
         # get configuration from each connected module
-        for module in flatten(self.modules):
+        for module in self._modules_flat:
             cfg = module.getXML()
             if cfg is not None:
                 modules.append(cfg)
         # build complete configuration tree
         root = E.PyCorderPlus(modules, version=__version__)
-        # write it to file
-        etree.ElementTree(root).write(filename, pretty_print=True, encoding="UTF-8")
+        # serialize and write it to file at once
+        data = etree.tostring(root, pretty_print=True, encoding="UTF-8", xml_declaration=True)
+        with open(filename, "wb") as f:
+            f.write(data)
 
     def loadPreferences(self):
         """
-        Load preferences from XML file
+        Load preferences from XML file,
+        ask for the amplifier type if there are no valid preferences
         :return:
         """
-        try:
-            # preferences will be stored to user home directory
-            homedir = QDir.home()
-            appdir = "." + self.application_name
-            if not homedir.cd(appdir):
-                # activating the device selection dialog
-                dlg = DlgAmpTypeSelection()
-                dlg.exec()
-                self.name_amplifier = dlg.name_amp
-                return
-            filename = homedir.absoluteFilePath("preferences.xml")
+        if not self._readPreferences():
+            self._promptAmpSelection()
 
+    def _readPreferences(self):
+        """
+        Read preferences from XML file
+        :return: True if valid preferences are available
+        """
+        # preferences will be stored to user home directory
+        appdir = QDir(QDir.home().absoluteFilePath(_APPDIR))
+        if not appdir.exists():
+            return False
+        filename = appdir.absoluteFilePath(_PREF_FILENAME)
+        if not os.path.isfile(filename):
+            # no preferences stored yet
+            return False
+
+        try:
             # read XML file
-            cfg = objectify.parse(filename)
+            cfg = etree.parse(filename, _PREF_PARSER)
             # check application and version
-            app = cfg.xpath("//PyCorderPlus")
+            app = _XP_ROOT(cfg)
             if (len(app) == 0) or (app[0].get("version") is None):
                 # configuration data not found
-                # activating the device selection dialog
-                dlg = DlgAmpTypeSelection()
-                dlg.exec()
-                # set amplifier type
-                self.name_amplifier = dlg.name_amp
-                return
-                # check version
-            version = app[0].get("version")
-
-            if cmpver(version, __version__, 2) > 0:
+                return False
+            if cmpver(app[0].get("version"), __version__, 2) > 0:
                 # wrong version
-                # activating the device selection dialog
-                dlg = DlgAmpTypeSelection()
-                dlg.exec()
-                # set amplifier type
-                self.name_amplifier = dlg.name_amp
-                return
-
-            # update preferences
-            preferences = app[0].preferences
-            self.configuration_dir = preferences.config_dir.pyval
-            self.configuration_file = preferences.config_file.pyval
-            self.name_amplifier = preferences.name_amplifier.pyval
-            self.log_dir = preferences.log_dir.pyval
-        except:
-            # activating the device selection dialog
-            dlg = DlgAmpTypeSelection()
-            dlg.exec()
-            # set amplifier type
-            self.name_amplifier = dlg.name_amp
+                return False
+        except (OSError, etree.XMLSyntaxError, TypeError):
+            # unreadable file or malformed version number
+            return False
+
+        # update preferences
+        preferences = app[0]
+        self.configuration_dir = preferences.findtext("preferences/config_dir", "")
+        self.configuration_file = preferences.findtext("preferences/config_file", "")
+        self.name_amplifier = preferences.findtext("preferences/name_amplifier", "")
+        self.log_dir = preferences.findtext("preferences/log_dir", "")
+        return self.name_amplifier in (NAME_AMP_ACTICHAMP, NAME_AMP_NEOREC)
+
+    def _promptAmpSelection(self):
+        """
+        Activate the device selection dialog and set the amplifier type
+        """
+        dlg = DlgAmpTypeSelection()
+        dlg.exec()
+        self.name_amplifier = dlg.name_amp
 
     def showLogEntries(self):
         """
@@ -544,22 +662,34 @@ class MainWindow(QMainWindow, frmMain.Ui_MainWindow):
         Save preferences to XML file
         :return:
         """
-        E = objectify.E
-        preferences = E.preferences(E.config_dir(self.configuration_dir),
-                                    E.config_file(self.configuration_file),
-                                    E.name_amplifier(self.name_amplifier),
-                                    E.log_dir(self.log_dir))
-        root = E.PyCorderPlus(preferences, version=__version__)
+        # the preferences document has a fixed layout, so we don't need a XML tree here
+        xml = (f'<?xml version="1.0" encoding="UTF-8"?>\n'
+               f'<PyCorderPlus version={quoteattr(__version__)}>\n'
+               f'  <preferences>\n'
+               f'    <config_dir>{escape(self.configuration_dir)}</config_dir>\n'
+               f'    <config_file>{escape(self.configuration_file)}</config_file>\n'
+               f'    <name_amplifier>{escape(self.name_amplifier)}</name_amplifier>\n'
+               f'    <log_dir>{escape(self.log_dir)}</log_dir>\n'
+               f'  </preferences>\n'
+               f'</PyCorderPlus>\n')
 
         # preferences will be stored to user home directory
         try:
             homedir = QDir.home()
-            appdir = "." + self.application_name
-            if not homedir.cd(appdir):
-                homedir.mkdir(appdir)
-                homedir.cd(appdir)
-            filename = homedir.absoluteFilePath("preferences.xml")
-            etree.ElementTree(root).write(filename, pretty_print=True, encoding="UTF-8")
+            appdir = QDir(homedir.absoluteFilePath(_APPDIR))
+            if not appdir.exists():
+                homedir.mkdir(_APPDIR)
+            filename = appdir.absoluteFilePath(_PREF_FILENAME)
+            # nothing to do if the preferences are unchanged
+            if os.path.isfile(filename):
+                with open(filename, "r", encoding="utf-8") as f:
+                    if f.read() == xml:
+                        return
+            # write to a temporary file first, so an interrupted write can't damage the preferences
+            tmpname = filename + ".tmp"
+            with open(tmpname, "w", encoding="utf-8") as f:
+                f.write(xml)
+            os.replace(tmpname, filename)
         except:
             pass
 
@@ -601,19 +731,23 @@ class MainWindow(QMainWindow, frmMain.Ui_MainWindow):
         Application wants to close, prevent closing if recording to file is still active
         """
 
-        if not self.topmodule.query("Stop"):
+        if self.topmodule is None:
+            # module chain not yet available
+            self.savePreferences()
+            event.accept()
+        elif not self.topmodule.query("Stop"):
             event.ignore()
         else:
             self.topmodule.stop(force=True)
 
-            if self.topmodule.__class__.__name__ == AMP_NeoRec.__name__:
+            if self._is_neorec:
                 # Shutting down the API and disabling the BLE device
                 self.topmodule.amp.close()
                 # self.dlgConn.close()
 
             self.savePreferences()
             # clean up modules
-            for module in flatten(self.modules):
+            for module in self._modules_flat:
                 module.terminate()
             event.accept()
 
@@ -629,10 +763,7 @@ class MainWindow(QMainWindow, frmMain.Ui_MainWindow):
         module chain, if available
         """
         dlg = DlgConfiguration()
-        for module in flatten(self.modules):
-            pane = module.get_configuration_pane()
-            if pane is not None:
-                dlg.addPane(pane)
+        dlg.addPanes([module.get_configuration_pane() for module in self._modules_flat])
         ok = dlg.exec()
         if ok:
             self.saveConfiguration()
@@ -644,6 +775,8 @@ class MainWindow(QMainWindow, frmMain.Ui_MainWindow):
         - Additional modules can be connected left -> right with tuples as list objects
         """
         self.modules = InstantiateModules(self.name_amplifier)
+        # the module chain doesn't change, so flatten it only once
+        self._modules_flat = tuple(flatten(self.modules))
 
     def updateModuleInfo(self):
         """
@@ -653,7 +786,7 @@ class MainWindow(QMainWindow, frmMain.Ui_MainWindow):
         """
         # get module information
         self.statusWidget.moduleinfo = ""
-        for module in flatten(self.modules):
+        for module in self._modules_flat:
             info = module.get_module_info()
             if info is not None:
                 self.statusWidget.moduleinfo += module._object_name + "\n"
@@ -749,21 +882,29 @@ class DlgConfiguration(QDialog, frmMainConfiguration.Ui_frmConfiguration):
         '''
         if pane is None:
             return
+        title = pane.windowTitle()
         currenttabs = len(self.panes)
         if currenttabs > 0:
             # add new tab
             tab = QWidget()
             tab.setObjectName("tab%d" % (currenttabs + 1))
-            gridLayout = QGridLayout(tab)
-            gridLayout.setObjectName("gridLayout%d" % (currenttabs + 1))
-            self.tabWidget.addTab(tab, "")
+            # a single pane per tab, a box layout is sufficient
+            layout = QVBoxLayout(tab)
+            layout.setObjectName("verticalLayout%d" % (currenttabs + 1))
+            self.tabWidget.addTab(tab, title)
         else:
-            gridLayout = self.gridLayout1
-            tab = self.tab1
+            layout = self.gridLayout1
+            self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab1), title)
 
         self.panes.append(pane)
-        gridLayout.addWidget(pane)
-        self.tabWidget.setTabText(self.tabWidget.indexOf(tab), pane.windowTitle())
+        layout.addWidget(pane)
+
+    def addPanes(self, panes):
+        ''' Insert new tabs for a list of module configuration panes
+        @param panes: list of module configuration panes (QFrame objects or None)
+        '''
+        for pane in panes:
+            self.addPane(pane)
 
 
 """
@@ -771,6 +912,27 @@ Utilities.
 """
 
 
+# version number categories
+_VER_RE = re.compile(r"\d+|\w+")
+
+
+def _fixup_ver(i):
+    """ Convert a version number category to int, if possible
+    """
+    try:
+        return int(i)
+    except ValueError:
+        return i
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_ver(v):
+    """ Split a version number into its categories
+    @return: tuple of version number categories
+    """
+    return tuple(map(_fixup_ver, _VER_RE.findall(v)))
+
+
 def cmpver(a, b, n=3):
     """ Compare two version numbers
     @param a: version number 1
@@ -778,27 +940,45 @@ def cmpver(a, b, n=3):
     @param n: number of categories to compare
     @return:  -1 if a<b, 0 if a=b, 1 if a>b
     """
+    a = _parse_ver(a)[:n]
+    b = _parse_ver(b)[:n]
+    return (a > b) - (a < b)
+
+
+def parseConfiguration(filename):
+    """ Get the objectify tree of a configuration file
+    @param filename: Full qualified XML file name
+    """
+    return objectify.parse(filename, _CFG_PARSER)
 
-    def fixup(i):
-        try:
-            return int(i)
-        except ValueError:
-            return i
 
-    a = list(map(fixup, re.findall(r"\d+|\w+", a)))
-    b = list(map(fixup, re.findall(r"\d+|\w+", b)))
-    return (a[:n] > b[:n]) - (a[:n] < b[:n])
+def getRootVersion(filename):
+    """ Get the version of a PyCorderPlus XML file without parsing the whole document
+    @param filename: Full qualified XML file name
+    @return: version string or None if the root element is not a PyCorderPlus element
+    """
+    with open(filename, "rb") as f:
+        # the first start event belongs to the root element
+        for event, elem in etree.iterparse(f, events=("start",)):
+            if elem.tag != "PyCorderPlus":
+                return None
+            return elem.get("version")
+    return None
 
 
 def flatten(lst):
     """ Flatten a list containing lists or tuples
     """
-    for elem in lst:
-        if type(elem) in (tuple, list):
-            for i in flatten(elem):
-                yield i
-        else:
+    # iterate with an explicit stack of iterators instead of nested generators
+    stack = collections.deque([iter(lst)])
+    while stack:
+        for elem in stack[-1]:
+            if isinstance(elem, (tuple, list)):
+                stack.append(iter(elem))
+                break
             yield elem
+        else:
+            stack.pop()
 
 
 """
@@ -813,18 +993,18 @@ class DlgAmpTypeSelection(frmDialogSelectAmp.Ui_SelectAmps, QDialog):
 
         # default selected amplifier
         self.radioButton.setChecked(True)
-        self.name_amp = AMP_ActiChamp.__name__
+        self.name_amp = NAME_AMP_ACTICHAMP
 
         self.buttonBox.clicked.connect(self.set_name)
 
     def set_name(self):
         # set name
         if self.radioButton.isChecked():
-            self.name_amp = AMP_ActiChamp.__name__
+            self.name_amp = NAME_AMP_ACTICHAMP
 
         # chose amplifier neorec
         if self.radioButton_2.isChecked():
-            self.name_amp = "AMP_NeoRec"
+            self.name_amp = NAME_AMP_NEOREC
 
     def closeEvent(self, event):
         res = QMessageBox.warning(
@@ -868,7 +1048,7 @@ class StatusBarWidget(QWidget, frmMainStatusBar.Ui_frmStatusBar):
         self.labelStatus_4.setAutoFillBackground(True)
 
         # name amplifier
-        self.amp = AMP_ActiChamp.__name__
+        self.amp = NAME_AMP_ACTICHAMP
 
         # log entries
         self.logFifo = collections.deque(maxlen=10000)
@@ -891,10 +1071,10 @@ class StatusBarWidget(QWidget, frmMainStatusBar.Ui_frmStatusBar):
         self.utilizationUpdateCounter = 0
         self.utilizationMaxValue = 0
 
-        if self.amp == AMP_ActiChamp.__name__:
+        if self.amp == NAME_AMP_ACTICHAMP:
             self.updateUtilization(0)
 
-        if self.amp == AMP_NeoRec.__name__:
+        if self.amp == NAME_AMP_NEOREC:
             self.updateBatteryLevel(0)
             self.labelStatus_4.setText(f"BLE: 0%")
 
@@ -939,7 +1119,6 @@ class StatusBarWidget(QWidget, frmMainStatusBar.Ui_frmStatusBar):
                     margin: 0.5px;
                 }
             """)
-            pass
         else:
             self.progressBarUtilization.setStyleSheet("""
                 QProgressBar {
@@ -953,7 +1132,6 @@ class StatusBarWidget(QWidget, frmMainStatusBar.Ui_frmStatusBar):
                     margin: 0.5px;
                 }
             """)
-            pass
 
     def updateBatteryLevel(self, level):
         """
@@ -980,7 +1158,6 @@ class StatusBarWidget(QWidget, frmMainStatusBar.Ui_frmStatusBar):
                             margin: 0.5px;
                         }
                     """)
-            pass
         else:
             self.progressBarUtilization.setStyleSheet("""
                         QProgressBar {
@@ -994,7 +1171,6 @@ class StatusBarWidget(QWidget, frmMainStatusBar.Ui_frmStatusBar):
                             margin: 0.5px;
                         }
                     """)
-            pass
 
     def updateEventStatus(self, event):
         """
@@ -1031,9 +1207,9 @@ class StatusBarWidget(QWidget, frmMainStatusBar.Ui_frmStatusBar):
                 else:
                     palette.setColor(self.labelStatus_4.backgroundRole(), self.defaultBkColor)
                 self.labelStatus_4.setPalette(palette)
-            elif event.status_field == "Utilization" and self.amp == AMP_ActiChamp.__name__:
+            elif event.status_field == "Utilization" and self.amp == NAME_AMP_ACTICHAMP:
                 self.updateUtilization(event.info)
-            elif event.status_field == "BatteryNeoRec" and self.amp == AMP_NeoRec.__name__:
+            elif event.status_field == "BatteryNeoRec" and self.amp == NAME_AMP_NEOREC:
                 self.updateBatteryLevel(event.info)
                 # add process severity
             elif event.status_field == "BLEUtilization":
@@ -1163,9 +1339,9 @@ def main(args):
             res = app.exec()
 
             if (
-                    res == MainWindow.RESTART and win.name_amplifier == AMP_NeoRec.__name__
+                    res == MainWindow.RESTART and win.name_amplifier == NAME_AMP_NEOREC
             ) or (
-                    res != MainWindow.RESTART and win.name_amplifier == AMP_ActiChamp.__name__
+                    res != MainWindow.RESTART and win.name_amplifier == NAME_AMP_ACTICHAMP
             ):
                 # show the battery disconnection reminder for actiCHamp
                 DlgBatteryInfo().exec()
@@ -20,7 +20,7 @@ import copy
 import time
 import traceback
 import threading
-import queue
+import collections
 import numpy as np
 
 from lxml import etree
@@ -39,6 +39,9 @@ def GetExceptionTraceBack():
     @return: tuple(string representation, filename, line number, module)
     '''
     exceptionType, exceptionValue, exceptionTraceback = sys.exc_info()
+    # only the innermost frame is reported, don't extract the whole stack
+    while exceptionTraceback.tb_next is not None:
+        exceptionTraceback = exceptionTraceback.tb_next
     tb = traceback.extract_tb(exceptionTraceback)[-1]
     fn = os.path.split(tb[0])[1]
     txt = f"{fn}, {tb[1]}, {tb[2]}"
@@ -85,6 +88,7 @@ class ErrorSeverity:
 class ModuleEvent:
     """ Generic module event
     """
+    __slots__ = ('module', 'type', 'info', 'severity', 'status_field', 'cmd_value', '_event_time_ns')
 
     def __init__(self, module, type, info="", severity=ErrorSeverity.IGNORE, status_field="", cmd_value=0):
         """ Initialize the event
@@ -101,7 +105,15 @@ class ModuleEvent:
         self.severity = severity
         self.status_field = status_field
         self.cmd_value = cmd_value
-        self.event_time = datetime.datetime.now()
+        self._event_time_ns = time.time_ns()
+
+    @property
+    def event_time(self):
+        ''' Event creation time, converted only if it is needed (e.g. for the log)
+        @return: datetime object
+        '''
+        ns = self._event_time_ns
+        return datetime.datetime.fromtimestamp(ns // 10**9).replace(microsecond=ns // 1000 % 10**6)
 
     def __str__(self):
         """ Event string representation
@@ -139,6 +151,8 @@ class ChannelGroup:
 class EEG_ChannelProperties:
     ''' Properties of EEG channels
     '''
+    __slots__ = ('xmlVersion', 'input', 'inputgroup', 'enable', 'name', 'refname', 'group',
+                 'lowpass', 'highpass', 'notchfilter', 'isReference', 'color', 'unit')
 
     def __init__(self, name):
         ''' Set default property values
@@ -163,6 +177,15 @@ class EEG_ChannelProperties:
         self.color = Qt.GlobalColor.darkBlue  #: display color
         self.unit = ""  #: channel unit string (use uV if empty)
 
+    def __copy__(self):
+        ''' Copy all properties directly, this is used for every channel of every data block
+        '''
+        cls = type(self)
+        copy_obj = cls.__new__(cls)
+        for name in cls.__slots__:
+            setattr(copy_obj, name, getattr(self, name))
+        return copy_obj
+
     def __lt__(self, other):
         ''' Compare two channels by name and group
         @param other: channel to compare with
@@ -226,6 +249,8 @@ class EEG_ChannelProperties:
 class EEG_Marker(object):
     """ Recording marker position and description
     """
+    # dt is only set by the storage module for generated "New Segment" markers
+    __slots__ = ('position', 'points', 'type', 'description', 'invisible', 'channel', 'date', 'dt')
 
     def __init__(self, position=0, points=1, type="unknown", description="", channel=0, date=False):
         ''' Create a new marker object
@@ -257,15 +282,17 @@ class EEG_DataBlock:
         self.markers = []  #: marker descriptions and positions
         self.impedances = []  #: impedance values [Ohm] -> obsolete since 1.0.6, should be left empty
         self.block_time = datetime.datetime.now()  #: block creation time
-        self.performance_timer = 0  #: processing time since block creation
-        self.performance_timer_max = 0  #: maximum module processing time for this block
+        self.performance_timer = 0  #: processing time since block creation in ns
+        self.performance_timer_max = 0  #: maximum module processing time for this block in ns
         self.recording_mode = RecordingMode.NORMAL  #: recording mode of this block
         self.ref_channel_name = ""  #: combined name of reference channels
 
     def __copy__(self):
-        ''' We always need a deep copy of channel properties, markers and impedance values
+        ''' We always need a deep copy of channel properties and markers,
+        impedance values are plain numbers and the block time is immutable
         '''
-        copy_obj = EEG_DataBlock(1, 1)
+        # all attributes are assigned below, skip the default buffer allocation
+        copy_obj = EEG_DataBlock.__new__(EEG_DataBlock)
         copy_obj.sample_counter = self.sample_counter
         copy_obj.sample_rate = self.sample_rate
         copy_obj.eeg_channels = self.eeg_channels
@@ -273,8 +300,8 @@ class EEG_DataBlock:
         copy_obj.sample_channel = self.sample_channel
         copy_obj.channel_properties = copy.deepcopy(self.channel_properties)
         copy_obj.markers = copy.deepcopy(self.markers)
-        copy_obj.impedances = copy.deepcopy(self.impedances)
-        copy_obj.block_time = copy.deepcopy(self.block_time)
+        copy_obj.impedances = list(self.impedances)
+        copy_obj.block_time = self.block_time
         copy_obj.performance_timer = self.performance_timer
         copy_obj.performance_timer_max = self.performance_timer_max
         copy_obj.recording_mode = self.recording_mode
@@ -286,14 +313,19 @@ class EEG_DataBlock:
         '''
         if other is None:
             return -1
+        if self is other:
+            return 0
         if self.sample_rate != other.sample_rate:
             return -1
-        if self.channel_properties.shape != other.channel_properties.shape:
-            return -1
-        if not (self.channel_properties == other.channel_properties).all():
-            return -1
         if self.recording_mode != other.recording_mode:
             return -1
+        if self.channel_properties.shape != other.channel_properties.shape:
+            return -1
+        # compare channels by name and group, like EEG_ChannelProperties.__lt__
+        # (the == operator of the object arrays only compares identity)
+        for ch, other_ch in zip(self.channel_properties, other.channel_properties):
+            if ch.name != other_ch.name or ch.group != other_ch.group:
+                return -1
         return 0
 
     @classmethod
@@ -303,15 +335,12 @@ class EEG_DataBlock:
         @param aux: number of AUX channels
         :param eeg_ch_names: names of EEG channels (only NeoRec)
         '''
+        if eeg_ch_names is None or len(eeg_ch_names) != eeg:
+            eeg_ch_names = ["Ch%d" % (c + 1) for c in range(eeg)]
         channel_properties = []
-        for c in range(0, eeg):
-
+        for c, name in enumerate(eeg_ch_names):
             # EEG channels
-            if eeg_ch_names is not None and len(eeg_ch_names) == eeg:
-                ch = EEG_ChannelProperties(eeg_ch_names[c])
-            else:
-                ch = EEG_ChannelProperties("Ch%d" % (c + 1))
-
+            ch = EEG_ChannelProperties(name)
             ch.inputgroup = ChannelGroup.EEG
             ch.group = ChannelGroup.EEG
             ch.input = c + 1
@@ -351,7 +380,10 @@ class ModuleBase(QObject):
         self._receivers = []
 
         # receiver input queue and data block
-        self._input_queue = queue.Queue(queuesize)
+        # (single producer / single consumer, deque append and popleft are thread safe)
+        self._input_queue = collections.deque(maxlen=queuesize)
+        self._input_event = threading.Event()  #: set if new data is available or the worker has to stop
+        self._has_parent = False  #: true if a parent module transmits data to this module
         self._input_data = EEG_DataBlock()
 
         # reset the I/O worker thread
@@ -375,8 +407,7 @@ class ModuleBase(QObject):
         ''' Start the data transfer. Don't override this method.
         '''
         # flush input queue
-        while not self._input_queue.empty():
-            self._input_queue.get_nowait()
+        self._input_queue.clear()
 
         # let derived class objects handle the start command
         try:
@@ -403,6 +434,7 @@ class ModuleBase(QObject):
         # terminate the data transfer worker thread
         if self._usethread:
             self._running = False
+            self._input_event.set()  # wake up an idle worker thread
             if self._work is not None:
                 self._work.join(5.0)  # wait 5s for terminating
                 self._work = None
@@ -482,6 +514,7 @@ class ModuleBase(QObject):
             receiver.start()
         # attach receiver
         self._receivers.append(receiver)
+        receiver._has_parent = True
 
         # get events from receiver
         receiver.signal_event.connect(self.receiver_event, Qt.ConnectionType.QueuedConnection)
@@ -500,6 +533,7 @@ class ModuleBase(QObject):
             return
         # detach receiver
         self._receivers.remove(receiver)
+        receiver._has_parent = False
         # propagate stop command to removed receiver
         receiver.stop()
 
@@ -592,27 +626,36 @@ class ModuleBase(QObject):
         ''' Override this method to do something else during worker thread idle time or to
         change the thread suspend time.
         '''
-        time.sleep(0.001)  # suspend thread (default = 1ms)
+        if not self._has_parent:
+            # nothing will arrive in the input queue (e.g. top module acquiring data)
+            time.sleep(0.001)  # suspend thread (default = 1ms)
+            return
+        # suspend thread until new data arrives (default timeout = 100ms)
+        self._input_event.clear()
+        if not self._input_queue:
+            self._input_event.wait(0.1)
         return
 
     def receive_data(self):
         try:
-            data = self._input_queue.get(False)
+            data = self._input_queue.popleft()
             return data
-        except:
+        except IndexError:
             return None
 
     def receive_data_available(self):
-        return self._input_queue.qsize()
+        return len(self._input_queue)
 
     def _transmit_data(self, data):
         ''' Put data into the input queue. This method is invoked from the parent module.
         Don't override this method.
         @param data: EEG_DataBlock object
         '''
-        try:
-            self._input_queue.put(data, False)
-        except:
+        # a full deque would silently drop the oldest block, so check for overrun first
+        if len(self._input_queue) < self._input_queue.maxlen:
+            self._input_queue.append(data)
+            self._input_event.set()
+        else:
             self.send_event(ModuleEvent(self._object_name, EventType.ERROR,
                                         "Input queue FULL, overrun!", severity=ErrorSeverity.NOTIFY))
 
@@ -621,45 +664,55 @@ class ModuleBase(QObject):
         puts the processed data into the output queue.
         Don't override this method.
         '''
+        # bind the objects used in the loop once
+        input_queue = self._input_queue
+        receivers = self._receivers
+        lock_acquire = self._thLock.acquire
+        lock_release = self._thLock.release
+        process_input = self.process_input
+        process_output = self.process_output
+        process_idle = self.process_idle
+        send_exception = self.send_exception
+        perf_counter_ns = time.perf_counter_ns
+
         while self._running:
             wt = 0  # reset performance timer
             # process input queue
-            self._thLock.acquire()
+            lock_acquire()
             try:
-                data = self._input_queue.get(False)
-                t = time.process_time()
-                self.process_input(data)
-                wt += time.process_time() - t
-                self._thLock.release()
-            except queue.Empty:
-                self._thLock.release()
+                if input_queue:
+                    data = input_queue.popleft()
+                    t = perf_counter_ns()
+                    process_input(data)
+                    wt += perf_counter_ns() - t
+                lock_release()
             except Exception as e:
-                self._thLock.release()
-                self.send_exception(e, severity=ErrorSeverity.STOP)
+                lock_release()
+                send_exception(e, severity=ErrorSeverity.STOP)
 
             # put data to all registered output queues
-            self._thLock.acquire()
+            lock_acquire()
             try:
-                self.output_timer = time.process_time()
-                data = self.process_output()
-                wt += time.process_time() - self.output_timer
-                self._thLock.release()
+                self.output_timer = perf_counter_ns()
+                data = process_output()
+                wt += perf_counter_ns() - self.output_timer
+                lock_release()
             except Exception as e:
-                self._thLock.release()
-                self.send_exception(e, severity=ErrorSeverity.STOP)
+                lock_release()
+                send_exception(e, severity=ErrorSeverity.STOP)
                 data = None
 
             if data is not None:
                 data.performance_timer_max = max(data.performance_timer_max, wt)
                 data.performance_timer += wt
-                for idx, receiver in enumerate(reversed(self._receivers)):
+                for idx, receiver in enumerate(reversed(receivers)):
                     if idx == 0:
                         receiver._transmit_data(data)
                     else:
                         receiver._transmit_data(copy.deepcopy(data))
 
             # give a chance for idle processing
-            self.process_idle()
+            process_idle()
 
     def send_exception(self, exception, severity=ErrorSeverity.STOP):
         ''' Send Exception as ModuleEvent object to all connected slots.
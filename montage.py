@@ -16,7 +16,7 @@ from collections import defaultdict
 
 from PyQt6.QtWidgets import QFrame, QMessageBox, QGridLayout, QVBoxLayout, QLabel, QSpacerItem, QSizePolicy
 from PyQt6.QtGui import QColor
-from PyQt6.QtCore import pyqtSignal, Qt
+from PyQt6.QtCore import Qt
 
 import textwrap
 
@@ -159,12 +159,13 @@ class MNT_Recording(ModuleBase):
 
     def _validateChannelLabels(self):
         # search for duplicate channel labels
-        labelList = [ch.name.lower() for ch in self.output_channel_properties if ch.enable]
-        labelDictionary = defaultdict(int)
-        for l in labelList:
-            labelDictionary[l] += 1
-        if labelDictionary and max(labelDictionary.values()) > 1:
-            return False
+        labels = set()
+        for ch in self.output_channel_properties:
+            if ch.enable:
+                label = ch.name.lower()
+                if label in labels:
+                    return False
+                labels.add(label)
         return True
 
     def _apply_montage(self, params):
@@ -331,8 +332,8 @@ class Montage:
     def reset(self):
         """ Reset the channel dictionary
         """
-        # dictionary with input group and input channel number as keys
-        self.channel_dict = defaultdict(lambda: defaultdict(dict))
+        # dictionary with (input group, input channel number, channel group) as keys
+        self.channel_dict = {}
 
     def add(self, channel):
         """ add a channel to the dictionary
@@ -341,26 +342,25 @@ class Montage:
         ch = copy.copy(channel)
         # remove trailing and leading spaces from channel label
         ch.name = ch.name.strip()
-        self.channel_dict[channel.inputgroup][channel.input][channel.group] = ch
+        self.channel_dict[(channel.inputgroup, channel.input, channel.group)] = ch
 
     def has_channel(self, channel):
         """ check if the dictionary has an entry for this channel
         @param channel: EEG_ChannelProperties object
         @return: True if channel entry available
         """
-        return channel.inputgroup in self.channel_dict and \
-            (channel.input in self.channel_dict[channel.inputgroup]) and \
-            (channel.group in self.channel_dict[channel.inputgroup][channel.input])
+        return (channel.inputgroup, channel.input, channel.group) in self.channel_dict
 
     def get_channel(self, channel):
         """ get channel from dictionary
         @param channel: EEG_ChannelProperties object
         @return: EEG_ChannelProperties object or None if channel is not available
         """
-        if not self.has_channel(channel):
+        ch = self.channel_dict.get((channel.inputgroup, channel.input, channel.group))
+        if ch is None:
             return None
-        ch = self.channel_dict[channel.inputgroup][channel.input][channel.group]
-        # remove trailing and leading spaces from channel label
+        # labels can be edited in the configuration table,
+        # so remove trailing and leading spaces from channel label
         ch.name = ch.name.strip()
         return ch
 
@@ -409,10 +409,8 @@ class Montage:
         """
         E = objectify.E
         channels = E.MontageChannels()
-        for inputgroup in self.channel_dict.values():
-            for inputnr in inputgroup.values():
-                for channel in inputnr.values():
-                    channels.append(channel.getXML())
+        for channel in self.channel_dict.values():
+            channels.append(channel.getXML())
         channels.attrib["version"] = str(self.xmlVersion)
         return channels
 
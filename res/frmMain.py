@@ -6,17 +6,18 @@
 # run again.  Do not edit this file unless you know what you are doing.
 
 
-from importlib.resources import path
+from importlib.resources import files
 from PyQt6 import QtCore, QtGui, QtWidgets
 
+_RES = files("res")
+
 
 class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
         MainWindow.setObjectName("MainWindow")
         MainWindow.resize(862, 604)
         icon = QtGui.QIcon()
-        with path("res", "PyCorderPlus.ico") as f_path:
-            icon.addPixmap(QtGui.QPixmap(str(f_path)), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        icon.addPixmap(QtGui.QPixmap(str(_RES / "PyCorderPlus.ico")), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
         MainWindow.setWindowIcon(icon)
         self.centralwidget = QtWidgets.QWidget(parent=MainWindow)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
@@ -59,8 +60,7 @@ class Ui_MainWindow(object):
         self.pushButtonConfiguration = QtWidgets.QPushButton(parent=self.scrollAreaWidgetContents)
         self.pushButtonConfiguration.setStyleSheet("text-align: left; padding-left: 10px; padding-top: 5px; padding-bottom: 5px")
         icon1 = QtGui.QIcon()
-        with path("res", "process.png") as f_path:
-            icon1.addPixmap(QtGui.QPixmap(str(f_path)), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        icon1.addPixmap(QtGui.QPixmap(str(_RES / "process.png")), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
         self.pushButtonConfiguration.setIcon(icon1)
         self.pushButtonConfiguration.setIconSize(QtCore.QSize(32, 32))
         self.pushButtonConfiguration.setObjectName("pushButtonConfiguration")
@@ -6,9 +6,11 @@
 # run again.  Do not edit this file unless you know what you are doing.
 
 
-from importlib.resources import path
+from importlib.resources import files
 from PyQt6 import QtCore, QtGui, QtWidgets
 
+_RES = files("res")
+
 
 class Ui_frmConfiguration(object):
     def setupUi(self, frmConfiguration):
@@ -16,8 +18,7 @@ class Ui_frmConfiguration(object):
         frmConfiguration.setWindowModality(QtCore.Qt.WindowModality.ApplicationModal)
         frmConfiguration.resize(861, 743)
         icon = QtGui.QIcon()
-        with path("res", "process.png") as f_path:
-            icon.addPixmap(QtGui.QPixmap(str(f_path)), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        icon.addPixmap(QtGui.QPixmap(str(_RES / "process.png")), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
         frmConfiguration.setWindowIcon(icon)
         self.gridLayout = QtWidgets.QGridLayout(frmConfiguration)
         self.gridLayout.setObjectName("gridLayout")
@@ -6,9 +6,11 @@
 # run again.  Do not edit this file unless you know what you are doing.
 
 
-from importlib.resources import path
+from importlib.resources import files
 from PyQt6 import QtCore, QtGui, QtWidgets
 
+_RES = files("res")
+
 
 class Ui_frmNeoRecOnline(object):
     def setupUi(self, frmNeoRecOnline):
@@ -32,10 +34,8 @@ class Ui_frmNeoRecOnline(object):
         self.pushButtonStartDefault.setMinimumSize(QtCore.QSize(100, 40))
         self.pushButtonStartDefault.setStyleSheet("text-align: left; padding-left: 10px;")
         icon = QtGui.QIcon()
-        with path("res", "play.png") as f_path:
-            icon.addPixmap(QtGui.QPixmap(str(f_path)), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
-        with path("res", "play_green.png") as f_path:
-            icon.addPixmap(QtGui.QPixmap(str(f_path)), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.On)
+        icon.addPixmap(QtGui.QPixmap(str(_RES / "play.png")), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        icon.addPixmap(QtGui.QPixmap(str(_RES / "play_green.png")), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.On)
         self.pushButtonStartDefault.setIcon(icon)
         self.pushButtonStartDefault.setIconSize(QtCore.QSize(32, 32))
         self.pushButtonStartDefault.setCheckable(True)
@@ -47,10 +47,8 @@ class Ui_frmNeoRecOnline(object):
         self.pushButtonStop = QtWidgets.QPushButton(parent=self.groupBoxMode)
         self.pushButtonStop.setMinimumSize(QtCore.QSize(100, 40))
         icon1 = QtGui.QIcon()
-        with path("res", "stop.png") as f_path:
-            icon1.addPixmap(QtGui.QPixmap(str(f_path)), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
-        with path("res", "stop_green.png") as f_path:
-            icon1.addPixmap(QtGui.QPixmap(str(f_path)), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.On)
+        icon1.addPixmap(QtGui.QPixmap(str(_RES / "stop.png")), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        icon1.addPixmap(QtGui.QPixmap(str(_RES / "stop_green.png")), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.On)
         self.pushButtonStop.setIcon(icon1)
         self.pushButtonStop.setIconSize(QtCore.QSize(32, 32))
         self.pushButtonStop.setCheckable(True)
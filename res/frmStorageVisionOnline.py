@@ -6,9 +6,11 @@
 # run again.  Do not edit this file unless you know what you are doing.
 
 
-from importlib.resources import path
+from importlib.resources import files
 from PyQt6 import QtCore, QtGui, QtWidgets
 
+_RES = files("res")
+
 
 class Ui_frmStorageVisionOnline(object):
     def setupUi(self, frmStorageVisionOnline):
@@ -148,10 +150,8 @@ class Ui_frmStorageVisionOnline(object):
         self.pushButtonRecord = QtWidgets.QPushButton(parent=self.groupBox)
         self.pushButtonRecord.setMinimumSize(QtCore.QSize(100, 40))
         icon = QtGui.QIcon()
-        with path("res", "record_grey.png") as f_path:
-            icon.addPixmap(QtGui.QPixmap(str(f_path)), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
-        with path("res", "record.png") as f_path:
-            icon.addPixmap(QtGui.QPixmap(str(f_path)), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.On)
+        icon.addPixmap(QtGui.QPixmap(str(_RES / "record_grey.png")), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        icon.addPixmap(QtGui.QPixmap(str(_RES / "record.png")), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.On)
         self.pushButtonRecord.setIcon(icon)
         self.pushButtonRecord.setIconSize(QtCore.QSize(32, 32))
         self.pushButtonRecord.setCheckable(True)
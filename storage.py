@@ -18,7 +18,7 @@ import platform
 import ctypes as ct
 
 from PyQt6.QtWidgets import QMessageBox, QFileDialog, QFrame
-from PyQt6.QtCore import QDir, QFile, Qt, QByteArray
+from PyQt6.QtCore import QDir, QFile, Qt
 from PyQt6.QtGui import QPalette, QColor, QIntValidator, QDoubleValidator
 
 from modbase import *
@@ -30,11 +30,13 @@ from res import frmStorageVisionConfig
 Storage module.
 """
 
+# write buffer size of the binary data file in bytes (a few data blocks)
+_DATA_FILE_BUFFER_SIZE = 64 * 1024
+
 
 class StorageVision(ModuleBase):
     """
     Vision Date Exchange Format
-    - Storage class using ctypes
     """
 
     def __init__(self, *args, **kwargs):
@@ -45,37 +47,13 @@ class StorageVision(ModuleBase):
         # 2: minimum required disk space added
         self.xmlVersion = 2
 
-        # get OS architecture (32/64-bit)
-        self.x64 = ("64" in platform.architecture()[0])
-
-        # load C library
-        try:
-            self.libc = ct.cdll.msvcrt  # Windows
-        except:
-            self.libc = ct.CDLL("libc.so.6")  # Linux
-
-        # set error handling for C library
-        def errcheck(res, func, args):
-            if not res:
-                raise IOError
-            return res
-
-        self.libc._wfopen.errcheck = errcheck
-        if self.x64:
-            self.libc._wfopen.restype = ct.c_int64
-            self.libc.fwrite.argtypes = [ct.c_void_p, ct.c_size_t, ct.c_size_t, ct.c_int64]
-            self.libc.fclose.argtypes = [ct.c_int64]
-        else:
-            self.libc._wfopen.restype = ct.c_void_p
-            self.libc.fwrite.argtypes = [ct.c_void_p, ct.c_size_t, ct.c_size_t, ct.c_void_p]
-            self.libc.fclose.argtypes = [ct.c_void_p]
-
         self.data = None
         self.dataavailable = False
         self.params = None
         self.last_impedance = None  #: last received impedance EEG block
         self.last_impedance_config = None  #: last received impedance configuration EEG block
         self.moduledescription = ""  #: description of connected modules
+        self.online_cfg = None  #: online configuration pane, created on first request
 
         # Amplifier name
         self.name_device = "actiCHamp"
@@ -85,7 +63,7 @@ class StorageVision(ModuleBase):
 
         # output files
         self.file_name = None  #: output file name
-        self.data_file = 0  #: clib data file handle
+        self.data_file = 0  #: buffered binary data file object
         self.header_file = 0  #: header file handle
         self.marker_file = 0  #: marker file handle
         self.marker_counter = 0  #: total number of markers written
@@ -174,13 +152,11 @@ class StorageVision(ModuleBase):
         if (self.data_file != 0) and not self.write_error:
             try:
                 t = time.process_time()
-                # convert data to float and write to data file
-                d = datablock.eeg_channels.transpose()
-                f = d.flatten().astype(np.float32)
-                sizeof_item = f.dtype.itemsize  # item size in bytes
-                write_items = len(f)  # number of items to write
-                nitems = self.libc.fwrite(f.tostring(), sizeof_item, write_items, self.data_file)
-                if nitems != write_items:
+                # convert data to multiplexed float32 in a single pass and write to data file
+                f = np.ascontiguousarray(datablock.eeg_channels.transpose(), dtype=np.float32)
+                # the array buffer is written directly, without an intermediate bytes copy
+                nitems = self.data_file.write(f)
+                if nitems != f.nbytes:
                     raise ModuleError(self._object_name, "Write to file %s failed" % self.file_name)
                 # write marker
                 self.data.markers = self._write_marker(self.data.markers, self.data.block_time,
@@ -190,7 +166,7 @@ class StorageVision(ModuleBase):
                 self.samples_written += samples
 
                 writetime = time.process_time() - t
-                # print("Write file: %.0f ms / %d Bytes / QSize %d"%(writetime*1000.0, nitems, self._input_queue.qsize()))
+                # print("Write file: %.0f ms / %d Bytes / QSize %d"%(writetime*1000.0, nitems, len(self._input_queue)))
             except Exception as e:
                 self.write_error = True  # indicate write error
                 self._thLock.release()  # release the thread lock because it is acquired by _close_recording()
@@ -294,6 +270,8 @@ class StorageVision(ModuleBase):
             except:
                 m += blockdate.strftime(",%Y%m%d%H%M%S%f")
         m += u"\n"
+        # the data up to this marker has to be on disk before the marker is
+        self.data_file.flush()
         self.marker_file.write(m)
         self.marker_file.flush()
 
@@ -303,11 +281,14 @@ class StorageVision(ModuleBase):
         """
         self._thLock.acquire()
         if self.data_file != 0:
-            try:
-                self.libc.fclose(self.data_file)
-                self.marker_file.close()
-            except Exception as e:
-                print(f"Failed to close recording files: {e}")
+            # closing the data file writes the remaining buffered samples
+            for f in (self.data_file, self.marker_file):
+                try:
+                    f.close()
+                except Exception as e:
+                    self.send_event(ModuleEvent(self._object_name, EventType.ERROR,
+                                                "Failed to close %s: %s" % (f.name, str(e)),
+                                                severity=ErrorSeverity.NOTIFY))
             self.data_file = 0
             self.data_file = 0
             self.online_cfg.set_recording_state(False)
@@ -536,7 +517,8 @@ class StorageVision(ModuleBase):
             # create EEG data file
             try:
                 self._thLock.acquire()
-                self.data_file = self.libc._wfopen(self.file_name, u"wb")
+                # the write buffer collects several data blocks for each disk write
+                self.data_file = open(self.file_name, "wb", buffering=_DATA_FILE_BUFFER_SIZE)
                 self.write_error = False
             except IOError as e:
                 self.header_file.close()
@@ -727,11 +709,13 @@ class StorageVision(ModuleBase):
 
     def get_online_configuration(self):
         ''' Get the online configuration pane
+        - the pane is created on the first call and reused afterwards
         '''
-        # create online configuration pane
-        self.online_cfg = _OnlineCfgPane(self)
-        # connect recording button
-        self.online_cfg.pushButtonRecord.clicked.connect(self.set_recording_file)
+        if self.online_cfg is None:
+            # create online configuration pane
+            self.online_cfg = _OnlineCfgPane(self)
+            # connect recording button
+            self.online_cfg.pushButtonRecord.clicked.connect(self.set_recording_file)
         return self.online_cfg
 
     def get_configuration_pane(self):
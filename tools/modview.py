@@ -189,7 +189,7 @@ class _DataTableModel(QAbstractTableModel):
         variable_name = self.columns[column]['variable']
         # get variable value
         if hasattr(data, variable_name):
-            d = vars(data)[variable_name]
+            d = getattr(data, variable_name)
             # get value from combobox list values?
             if 'indexed' in self.columns[column] and variable_name in self.cblist:
                 try:
@@ -231,18 +231,18 @@ class _DataTableModel(QAbstractTableModel):
 
         # set variable value
         if hasattr(data, variable_name):
-            t = type(vars(data)[variable_name])
+            t = type(getattr(data, variable_name))
             if t is bool:
-                vars(data)[variable_name] = bool(value)
+                setattr(data, variable_name, bool(value))
                 return True
             elif t is float:
-                vars(data)[variable_name] = float(value)
+                setattr(data, variable_name, float(value))
                 return True
             elif t is int:
-                vars(data)[variable_name] = int(value)
+                setattr(data, variable_name, int(value))
                 return True
             elif t is str:
-                vars(data)[variable_name] = "%s" % str(value)
+                setattr(data, variable_name, "%s" % str(value))
                 return True
             else:
                 return False